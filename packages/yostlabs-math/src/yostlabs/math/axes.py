@@ -1,5 +1,14 @@
 """Module for working with axis orders."""
 
+import functools
+
+#Numpy is optional, it is only used to accelerate the batched swap functions
+#when the caller passes ndarrays. The scalar paths are pure python.
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
 
 class AxisOrder:
     """
@@ -19,15 +28,15 @@ class AxisOrder:
         - Common: NED (North-East-Down), ENU (East-North-Up)
     
     Attributes:
-        order (list[int]): Axis mapping [0-2] where 0=X, 1=Y, 2=Z
-        multipliers (list[int]): Direction multipliers, 1 or -1
+        order (tuple[int, ...]): Axis mapping [0-2] where 0=X, 1=Y, 2=Z
+        multipliers (tuple[int, ...]): Direction multipliers, 1 or -1
         is_right_handed (bool): True if right-handed coordinate system
-    
+
     Examples:
         >>> axis = AxisOrder('xyz')
         >>> axis.to_xyz_string()  # 'xyz'
         >>> axis.to_compass_string()  # 'eun'
-        >>> axis.order  # [0, 1, 2]
+        >>> axis.order  # (0, 1, 2)
         >>> axis.is_right_handed  # True
     """
     
@@ -35,12 +44,33 @@ class AxisOrder:
     _COMPASS_TO_AXIS = {'e': 0, 'w': 0, 'u': 1, 'd': 1, 'n': 2, 's': 2}
     _NEGATIVE_COMPASS = "wds"
     _AXIS_TO_COMPASS = [['e', 'w'], ['u', 'd'], ['n', 's']]  # [axis][positive/negative]
-    
+    _XYZ_TO_AXIS = {'x': 0, 'y': 1, 'z': 2}
+
+    #Parse results keyed by the normalized axis string. Callers tend to rebuild
+    #the same handful of orders (AxisOrder('xyz') etc.) repeatedly.
+    _parse_cache: dict[str, tuple[tuple[int, ...], tuple[int, ...]]] = {}
+
     def __init__(self, axis_string: str):
         """Initialize from axis string ('xyz', 'ned', etc.)."""
         axis_string = axis_string.lower().strip()
-        self.order, self.multipliers = self._parse_axis_string(axis_string)
+        cached = AxisOrder._parse_cache.get(axis_string)
+        if cached is None:
+            order, multipliers = self._parse_axis_string(axis_string)
+            cached = (tuple(order), tuple(multipliers))
+            AxisOrder._parse_cache[axis_string] = cached
+        #Stored as tuples: AxisOrder is treated as immutable, and tuples hash and
+        #compare without reboxing
+        self.order, self.multipliers = cached
         self.is_right_handed = self._compute_handedness(self.order, self.multipliers)
+        #Aliases kept for callers that used the explicit tuple attributes
+        self.order_tuple = self.order
+        self.multipliers_tuple = self.multipliers
+        #Inverse permutation: inverse_order[axis] = position of that axis in order.
+        #Lets the swap paths avoid index scans.
+        inverse = [0, 0, 0]
+        for i, o in enumerate(self.order):
+            inverse[o] = i
+        self.inverse_order = tuple(inverse)
     
     @staticmethod
     def _parse_axis_string(axis: str) -> tuple[list[int], list[int]]:
@@ -54,30 +84,58 @@ class AxisOrder:
                 if c == '-':
                     multipliers[index] = -1
                 else:
-                    order[index] = ord(c) - ord('x')
+                    axis_index = AxisOrder._XYZ_TO_AXIS.get(c)
+                    if axis_index is None:
+                        raise ValueError(f"Invalid axis character '{c}' in axis string '{axis}'")
+                    order[index] = axis_index
                     index += 1
         else:  # Compass notation
             for i, c in enumerate(axis):
-                order[i] = AxisOrder._COMPASS_TO_AXIS[c]
+                axis_index = AxisOrder._COMPASS_TO_AXIS.get(c)
+                if axis_index is None:
+                    raise ValueError(f"Invalid axis character '{c}' in axis string '{axis}'")
+                order[i] = axis_index
                 if c in AxisOrder._NEGATIVE_COMPASS:
                     multipliers[i] = -1
         
         return order, multipliers
     
     @staticmethod
-    def _compute_handedness(order: list[int], multipliers: list[int]) -> bool:
+    def _compute_handedness(order: tuple[int, ...], multipliers: tuple[int, ...]) -> bool:
         """Compute if coordinate system is right-handed."""
-        num_swaps = sum(1 for i in range(3) if i != order[i])
+        num_swaps = (order[0] != 0) + (order[1] != 1) + (order[2] != 2)
         right_handed = (num_swaps == 2)
-        if multipliers.count(-1) & 1:  # Odd negations flip handedness
+        if multipliers[0] * multipliers[1] * multipliers[2] < 0:  # Odd negations flip handedness
             right_handed = not right_handed
         return right_handed
     
+    #Cache of (perm, signs) keyed by the source and destination order/multiplier
+    #tuples. There are only 48 valid axis orders, so this stays small while
+    #letting the streaming paths skip the index lookups entirely.
+    _permutation_cache: dict[tuple, tuple[tuple[int, ...], tuple[int, ...]]] = {}
+
+    def permutation_to(self, other: 'AxisOrder') -> tuple[tuple[int, ...], tuple[int, ...]]:
+        """
+        Compute the permutation and signs that transform a vector from this axis
+        order into the other axis order, such that out[i] = vec[perm[i]] * signs[i].
+
+        Results are cached per (self, other) pair since this is called per sample
+        on streaming paths.
+        """
+        key = (self.order, self.multipliers, other.order, other.multipliers)
+        cached = AxisOrder._permutation_cache.get(key)
+        if cached is not None:
+            return cached
+        perm = tuple(self.inverse_order[other.order[i]] for i in range(3))
+        signs = tuple(self.multipliers[perm[i]] * other.multipliers[i] for i in range(3))
+        result = (perm, signs)
+        AxisOrder._permutation_cache[key] = result
+        return result
+
     def swap_to(self, new_order: 'AxisOrder', vector: list[float], rotational: bool = False) -> list[float]:
         swapped = swap_vector_axes(vector, self, new_order, negate_on_handedness_change=rotational)
         # Copy any additional elements (e.g. for quaternions)
-        for i in range(3, len(vector)):
-            swapped.append(vector[i])
+        swapped += vector[3:]
         return swapped
 
     def to_xyz_string(self, include_plus: bool = False) -> str:
@@ -106,7 +164,14 @@ class AxisOrder:
         return f"AxisOrder('{self.to_xyz_string()}')"
     
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if isinstance(other, str):
+            #Canonical strings compare straight against the parse cache without
+            #constructing a throwaway AxisOrder
+            cached = AxisOrder._parse_cache.get(other.lower().strip())
+            if cached is not None:
+                return self.order == cached[0] and self.multipliers == cached[1]
             try:
                 other = AxisOrder(other)
             except (ValueError, TypeError):
@@ -116,7 +181,7 @@ class AxisOrder:
         return self.order == other.order and self.multipliers == other.multipliers
     
     def __hash__(self) -> int:
-        return hash((tuple(self.order), tuple(self.multipliers)))
+        return hash((self.order_tuple, self.multipliers_tuple))
     
     @classmethod
     def from_order_and_multipliers(cls, order: list[int], multipliers: list[int]) -> 'AxisOrder':
@@ -125,7 +190,75 @@ class AxisOrder:
         return cls(axis_str)
 
 
-def swap_vector_axes(vec: list[float], current_order: AxisOrder | str, new_order: AxisOrder | str, 
+def _precompute_parse_cache():
+    """Populate the parse cache with all 48 valid orders in both notations so
+    AxisOrder construction is a single dict hit for any canonical string."""
+    import itertools
+    for order in itertools.permutations((0, 1, 2)):
+        for multipliers in itertools.product((1, -1), repeat=3):
+            entry = (order, multipliers)
+            xyz = ''.join(('-' if m < 0 else '') + 'xyz'[o] for o, m in zip(order, multipliers))
+            compass = ''.join(AxisOrder._AXIS_TO_COMPASS[o][0 if m > 0 else 1] for o, m in zip(order, multipliers))
+            AxisOrder._parse_cache[xyz] = entry
+            AxisOrder._parse_cache[compass] = entry
+_precompute_parse_cache()
+
+
+@functools.lru_cache(maxsize=64)
+def _transform_table(current_order: AxisOrder, new_order: AxisOrder,
+                     rotational: bool) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """
+    Cached (perm, signs) pair for transforming between two axis orders, with the
+    handedness negation for rotational quantities already folded into the signs.
+    """
+    perm, signs = current_order.permutation_to(new_order)
+    if rotational and (current_order.is_right_handed != new_order.is_right_handed):
+        signs = (-signs[0], -signs[1], -signs[2])
+    return perm, signs
+
+
+@functools.lru_cache(maxsize=64)
+def _axis_swap_matrix(current_order: AxisOrder, new_order: AxisOrder, rotational: bool):
+    perm, signs = _transform_table(current_order, new_order, rotational)
+    rows = [[0, 0, 0] for _ in range(3)]
+    for i in range(3):
+        rows[i][perm[i]] = signs[i]
+    return tuple(tuple(row) for row in rows)
+
+
+def axis_swap_matrix(current_order: AxisOrder | str, new_order: AxisOrder | str,
+                     rotational: bool = False) -> tuple[tuple[int, ...], ...]:
+    """
+    Get the 3x3 row-major matrix M such that M applied to a vector performs the
+    same transform as swap_vector_axes (out[i] = sum(M[i][j] * vec[j])).
+
+    Each row holds a single +/-1 entry, so the matrix form is mainly useful for
+    composing with other matrices (e.g. rotation matrices) or feeding vectorized
+    pipelines, rather than for transforming single vectors.
+
+    Parameters
+    ----------
+    current_order : AxisOrder or str
+        Axis order the vectors start in
+    new_order : AxisOrder or str
+        Axis order to transform into
+    rotational : bool, optional
+        If True, fold in the handedness negation used for rotational
+        quantities. Default is False.
+
+    Returns
+    -------
+    tuple[tuple[int, ...], ...]
+        The cached 3x3 matrix as nested tuples
+    """
+    if isinstance(current_order, str):
+        current_order = AxisOrder(current_order)
+    if isinstance(new_order, str):
+        new_order = AxisOrder(new_order)
+    return _axis_swap_matrix(current_order, new_order, rotational)
+
+
+def swap_vector_axes(vec: list[float], current_order: AxisOrder | str, new_order: AxisOrder | str,
                      negate_on_handedness_change: bool = False) -> list[float]:
     """
     Swap the axes of a 3D vector from one axis order to another.
@@ -158,21 +291,55 @@ def swap_vector_axes(vec: list[float], current_order: AxisOrder | str, new_order
         current_order = AxisOrder(current_order)
     if isinstance(new_order, str):
         new_order = AxisOrder(new_order)
-    
-    # Undo the old negations
-    base_vec = [vec[i] * current_order.multipliers[i] for i in range(3)]
-    
-    # Swap positions and apply new multipliers
-    new_vec = [0.0, 0.0, 0.0]
-    for i in range(3):
-        new_vec[i] = base_vec[current_order.order.index(new_order.order[i])]
-        new_vec[i] *= new_order.multipliers[i]
 
-    # If handedness changed and negate_on_handedness_change is True, negate the vector
-    if negate_on_handedness_change and (current_order.is_right_handed != new_order.is_right_handed):
-        new_vec = [-v for v in new_vec]
+    # Apply the cached transform. The signs combine undoing the old negations,
+    # applying the new ones, and any handedness negation in a single pass.
+    perm, signs = _transform_table(current_order, new_order, negate_on_handedness_change)
+    p0, p1, p2 = perm
+    s0, s1, s2 = signs
+    return [vec[p0] * s0, vec[p1] * s1, vec[p2] * s2]
+
+
+def swap_vector_axes_batch(vectors, current_order: AxisOrder | str, new_order: AxisOrder | str,
+                           negate_on_handedness_change: bool = False):
+    """
+    Swap the axes of many 3D vectors at once from one axis order to another.
+
+    Parameters
+    ----------
+    vectors : list[list[float]] or (N,3) numpy.ndarray
+        The vectors to transform
+    current_order : AxisOrder or str
+        Current axis order of the vectors
+    new_order : AxisOrder or str
+        Target axis order for the vectors
+    negate_on_handedness_change : bool, optional
+        Same meaning as in swap_vector_axes. Default is False.
+
+    Returns
+    -------
+    list[list[float]] or numpy.ndarray
+        The transformed vectors, matching the input container type
+
+    Notes
+    -----
+    When numpy is installed and an ndarray is passed, the transform is a single
+    vectorized fancy-index + multiply, which is significantly faster than the
+    per-sample path for streamed data.
+    """
+    if isinstance(current_order, str):
+        current_order = AxisOrder(current_order)
+    if isinstance(new_order, str):
+        new_order = AxisOrder(new_order)
+
+    perm, signs = _transform_table(current_order, new_order, negate_on_handedness_change)
+
+    if _np is not None and isinstance(vectors, _np.ndarray):
+        return vectors[:, perm] * _np.asarray(signs)
 
-    return new_vec
+    p0, p1, p2 = perm
+    s0, s1, s2 = signs
+    return [[v[p0] * s0, v[p1] * s1, v[p2] * s2] for v in vectors]
 
 
 def swap_quaternion_axes(quat: list[float], current_order: AxisOrder | str, new_order: AxisOrder | str) -> list[float]:
@@ -198,7 +365,57 @@ def swap_quaternion_axes(quat: list[float], current_order: AxisOrder | str, new_
     When the handedness changes, the quaternion is inverted to maintain the same
     rotation direction (since different-handed systems rotate in opposite directions).
     """
-    return swap_vector_axes(quat[:3], current_order, new_order, negate_on_handedness_change=True) + [quat[3]]
+    if isinstance(current_order, str):
+        current_order = AxisOrder(current_order)
+    if isinstance(new_order, str):
+        new_order = AxisOrder(new_order)
+
+    # Build the full 4-element result directly rather than slicing off the
+    # vector part and concatenating W back on
+    perm, signs = _transform_table(current_order, new_order, True)
+    p0, p1, p2 = perm
+    s0, s1, s2 = signs
+    return [quat[p0] * s0, quat[p1] * s1, quat[p2] * s2, quat[3]]
+
+def swap_quaternion_axes_batch(quats, current_order: AxisOrder | str, new_order: AxisOrder | str):
+    """
+    Swap the axes of many quaternions (XYZW format) at once from one axis order
+    to another.
+
+    Parameters
+    ----------
+    quats : list[list[float]] or (N,4) numpy.ndarray
+        The quaternions to transform
+    current_order : AxisOrder or str
+        Current axis order of the quaternions
+    new_order : AxisOrder or str
+        Target axis order for the quaternions
+
+    Returns
+    -------
+    list[list[float]] or numpy.ndarray
+        The transformed quaternions, matching the input container type
+
+    Notes
+    -----
+    Like swap_vector_axes_batch, passing an ndarray with numpy installed runs
+    the whole batch as one vectorized fancy-index + multiply. The handedness
+    inversion is folded into the signs, same as swap_quaternion_axes.
+    """
+    if isinstance(current_order, str):
+        current_order = AxisOrder(current_order)
+    if isinstance(new_order, str):
+        new_order = AxisOrder(new_order)
+
+    perm, signs = _transform_table(current_order, new_order, True)
+
+    if _np is not None and isinstance(quats, _np.ndarray):
+        return quats[:, (*perm, 3)] * _np.asarray((*signs, 1))
+
+    p0, p1, p2 = perm
+    s0, s1, s2 = signs
+    return [[q[p0] * s0, q[p1] * s1, q[p2] * s2, q[3]] for q in quats]
+
 
 def axis_to_unit_vector(axis: str):
     if isinstance(axis, str):
@@ -1,23 +1,75 @@
+import functools
 import math
 import yostlabs.math.vector as _vec
 from yostlabs.math.axes import AxisOrder
 
+#Numpy is optional, it is only used to accelerate the batched functions
+#when the caller passes ndarrays. The scalar paths are pure python.
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
 def quat_mul(a: list[float], b: list[float]):
-    out = [0, 0, 0, 0]
-    x = 0; y = 1; z = 2; w = 3
-    out[w] = a[w]*b[w] - a[x]*b[x] - a[y]*b[y] - a[z]*b[z]
-    out[x] = a[w]*b[x] + a[x]*b[w] + a[y]*b[z] - a[z]*b[y]
-    out[y] = a[w]*b[y] + a[y]*b[w] + a[z]*b[x] - a[x]*b[z]
-    out[z] = a[w]*b[z] + a[z]*b[w] + a[x]*b[y] - a[y]*b[x]
-    return out
+    ax, ay, az, aw = a[0], a[1], a[2], a[3]
+    bx, by, bz, bw = b[0], b[1], b[2], b[3]
+    return [aw*bx + ax*bw + ay*bz - az*by,
+            aw*by + ay*bw + az*bx - ax*bz,
+            aw*bz + az*bw + ax*by - ay*bx,
+            aw*bw - ax*bx - ay*by - az*bz]
+
+def quat_mul_batch(a, b):
+    """
+    Hamilton product of many quaternion pairs at once (XYZW format).
+
+    Parameters
+    ----------
+    a, b : list[list[float]] or (N,4) numpy.ndarray
+        The quaternion operands, pairwise
+
+    Returns
+    -------
+    list[list[float]] or numpy.ndarray
+        out[i] = a[i] * b[i], matching the input container type
+
+    Notes
+    -----
+    When numpy is installed and ndarrays are passed, the product is computed
+    with column-wise vector ops instead of per-sample Python arithmetic.
+    """
+    if _np is not None and isinstance(a, _np.ndarray) and isinstance(b, _np.ndarray):
+        ax, ay, az, aw = a[:, 0], a[:, 1], a[:, 2], a[:, 3]
+        bx, by, bz, bw = b[:, 0], b[:, 1], b[:, 2], b[:, 3]
+        return _np.stack([aw*bx + ax*bw + ay*bz - az*by,
+                          aw*by + ay*bw + az*bx - ax*bz,
+                          aw*bz + az*bw + ax*by - ay*bx,
+                          aw*bw - ax*bx - ay*by - az*bz], axis=1)
+    return [quat_mul(qa, qb) for qa, qb in zip(a, b)]
+
+#Unit basis vectors indexed by axis, for rotating an axis without building a list
+_UNIT_AXES = ((1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0))
+
+#Scalar kernel for rotating a vector by a unit quaternion using the Rodrigues
+#form v' = v + w*t + q_xyz x t where t = 2*(q_xyz x v). This is half the
+#arithmetic of the two full Hamilton products and allocates nothing.
+def _rotate_vec_scalars(qx, qy, qz, qw, vx, vy, vz):
+    tx = 2.0 * (qy*vz - qz*vy)
+    ty = 2.0 * (qz*vx - qx*vz)
+    tz = 2.0 * (qx*vy - qy*vx)
+    return (vx + qw*tx + qy*tz - qz*ty,
+            vy + qw*ty + qz*tx - qx*tz,
+            vz + qw*tz + qx*ty - qy*tx)
+
+#Clamp to the valid asin/acos domain. The surrounding math should already land
+#in range, but floating point can give values like 1.0000002 which NAN, so the
+#common in-range case is just the chained compare instead of two builtin calls.
+def _clamp11(v):
+    return v if -1.0 <= v <= 1.0 else (1.0 if v > 0.0 else -1.0)
 
 #Rotates quaternion b by quaternion a, it does not combine them
 def quat_rotate(a: list[float], b: list[float]):
-    inv = quat_inverse(a)
-    axis = [b[0], b[1], b[2], 0]
-    halfway = quat_mul(a, axis)
-    final = quat_mul(halfway, inv)
-    return [*final[:3], b[3]]
+    x, y, z = _rotate_vec_scalars(a[0], a[1], a[2], a[3], b[0], b[1], b[2])
+    return [x, y, z, b[3]]
 
 def quat_inverse(quat: list[float]):
     #Note: While technically negating just the W is rotationally equivalent, this is not a good idea
@@ -25,23 +77,23 @@ def quat_inverse(quat: list[float]):
     return [-quat[0], -quat[1], -quat[2], quat[3]]
 
 def quaternion_global_to_local(quat, vec):
-    inverse = quat_inverse(quat)
-    return quat_rotate_vec(inverse, vec)
+    #Rotating by the inverse is just the kernel with the vector part negated,
+    #no need to materialize the inverse quaternion
+    x, y, z = _rotate_vec_scalars(-quat[0], -quat[1], -quat[2], quat[3], vec[0], vec[1], vec[2])
+    return [x, y, z]
 
 def quaternion_local_to_global(quat, vec):
     return quat_rotate_vec(quat, vec)
 
 def quat_rotate_vec(quat: list[float], vec: list[float]):
-    inv = quat_inverse(quat)
-    tmp = [vec[0], vec[1], vec[2], 0]
-    halfway = quat_mul(quat, tmp)
-    final = quat_mul(halfway, inv)
-    return [final[0], final[1], final[2]]
+    x, y, z = _rotate_vec_scalars(quat[0], quat[1], quat[2], quat[3], vec[0], vec[1], vec[2])
+    return [x, y, z]
 
 def quat_from_axis_angle(axis: list[float], angle: float):
-    imaginary = math.sin(angle / 2)
+    half_angle = angle * 0.5
+    imaginary = math.sin(half_angle)
     quat = [imaginary * v for v in axis]
-    quat.append(math.cos(angle / 2))
+    quat.append(math.cos(half_angle))
 
     return quat
 
@@ -99,9 +151,11 @@ def quat_from_two_vectors(forward, down, axis_order: AxisOrder = AxisOrder("xyz"
     
     return quat
 
-def quaternion_to_3x3_rotation_matrix(quat):
+def quaternion_to_3x3_rotation_matrix(quat, flat: bool = False):
     """
-    Convert a quaternion in form x, y, z, w to a rotation matrix
+    Convert a quaternion in form x, y, z, w to a rotation matrix.
+    Set flat to True to get the 9 elements as a single row-major list,
+    which skips the nested wrapping for callers feeding flat pipelines.
     """
     x, y, z, w = quat
 
@@ -118,21 +172,15 @@ def quaternion_to_3x3_rotation_matrix(quat):
     fTyz = fTz * y
     fTzz = fTz * z
 
-    out = [0] * 9
-    out[0] = 1.0-(fTyy+fTzz)
-    out[1] = fTxy-fTwz
-    out[2] = fTxz+fTwy
-    out[3] = fTxy+fTwz
-    out[4] = 1.0-(fTxx+fTzz)
-    out[5] = fTyz-fTwx
-    out[6] = fTxz-fTwy
-    out[7] = fTyz + fTwx
-    out[8] = 1.0 - (fTxx+fTyy)
+    if flat:
+        return [1.0-(fTyy+fTzz), fTxy-fTwz, fTxz+fTwy,
+                fTxy+fTwz, 1.0-(fTxx+fTzz), fTyz-fTwx,
+                fTxz-fTwy, fTyz+fTwx, 1.0-(fTxx+fTyy)]
 
     return [
-        [out[0], out[1], out[2]],
-        [out[3], out[4], out[5]],
-        [out[6], out[7], out[8]],
+        [1.0-(fTyy+fTzz), fTxy-fTwz, fTxz+fTwy],
+        [fTxy+fTwz, 1.0-(fTxx+fTzz), fTyz-fTwx],
+        [fTxz-fTwy, fTyz+fTwx, 1.0-(fTxx+fTyy)],
     ]
 
 def quaternion_from_3x3_rotation_matrix(matrix):
@@ -196,6 +244,17 @@ def quaternion_from_3x3_rotation_matrix(matrix):
     
     return [x, y, z, w]
 
+#Classification of the 12 valid Euler orders into the 4 families q2ea handles,
+#precomputed so the conversion does one dict lookup instead of a branch chain.
+#Family: 0 = Non-Circular Repeated, 1 = Non-Circular Non-Repeated,
+#        2 = Circular Repeated,     3 = Circular Non-Repeated
+_EULER_ORDER_FAMILIES: dict[tuple[int, int, int], int] = {
+    (0, 2, 0): 0, (1, 0, 1): 0, (2, 1, 2): 0,   #XZX, YXY, ZYZ
+    (0, 2, 1): 1, (1, 0, 2): 1, (2, 1, 0): 1,   #XZY, YXZ, ZYX
+    (0, 1, 0): 2, (1, 2, 1): 2, (2, 0, 2): 2,   #XYX, YZY, ZXZ
+    (0, 1, 2): 3, (1, 2, 0): 3, (2, 0, 1): 3,   #XYZ, YZX, ZXY
+}
+
 #Quat is expected in XYZW order
 #https://www.euclideanspace.com/maths/geometry/rotations/conversions/quaternionToEuler/quat_2_euler_paper_ver2-1.pdf
 def q2ea(in_quat: list[float], order: list[int]) -> list[float]:
@@ -210,13 +269,10 @@ def q2ea(in_quat: list[float], order: list[int]) -> list[float]:
 
     #Find the direction the final axis ends up pointing after the full rotation
     #Note that this vector does not change when the third rotation is being applied.
-    v3_rot = [0, 0, 0]
-    v3_rot[i3] = 1 
-    v3_rot = quat_rotate_vec(in_quat, v3_rot)
+    v3_rot = list(_rotate_vec_scalars(*in_quat, *_UNIT_AXES[i3]))
 
     #NOTE: Whenever using asin/acos, ensure the input is in range of -1 <= x <= 1
-    #All this math should result in that, but floating point sometimes causes values like 1.0000002 which can cause NANs
-    v3_rot = [max(-1, min(1, v)) for v in v3_rot]
+    v3_rot = [_clamp11(v3_rot[0]), _clamp11(v3_rot[1]), _clamp11(v3_rot[2])]
 
     #Can now discover the first 2 rotations
     #This is because the first two rotations determine the direction of the final axis,
@@ -224,32 +280,17 @@ def q2ea(in_quat: list[float], order: list[int]) -> list[float]:
     #positions the third axis underneath its final spot, and the second rotation swings it up to its final position.
     #These can be calculated using trig and the known axis pattern.
 
-	#Non-Circular, Repeated Axes
-    #XZX, YXY, ZYZ
-    if (i1 == 0 and i2 == 2 and i3 == 0) or     \
-    (i1 == 1 and i2 == 0 and i3 == 1) or        \
-    (i1 == 2 and i2 == 1 and i3 == 2):      
+    family = _EULER_ORDER_FAMILIES.get((i1, i2, i3))
+    if family == 0:     #Non-Circular, Repeated Axes (XZX, YXY, ZYZ)
         out[0] = math.atan2(v3_rot[i1nn], v3_rot[i1n])
         out[1] = math.acos(v3_rot[i1])
-	#Non-Circular, Non-Repeated Axes
-    #XZY, YXZ, ZYX
-    elif (i1 == 0 and i2 == 2 and i3 == 1) or   \
-    (i1 == 1 and i2 == 0 and i3 == 2) or        \
-    (i1 == 2 and i2 == 1 and i3 == 0):          
+    elif family == 1:   #Non-Circular, Non-Repeated Axes (XZY, YXZ, ZYX)
         out[0] = math.atan2(v3_rot[i1nn], v3_rot[i1n])
         out[1] = -math.asin(v3_rot[i1])
-	#Circular, Repeated Axes
-    #XYX, YZY, ZXZ
-    elif (i1 == 0 and i2 == 1 and i3 == 0) or   \
-    (i1 == 1 and i2 == 2 and i3 == 1) or        \
-    (i1 == 2 and i2 == 0 and i3 == 2):
+    elif family == 2:   #Circular, Repeated Axes (XYX, YZY, ZXZ)
         out[0] = math.atan2(v3_rot[i1n], -v3_rot[i1nn])
         out[1] = math.acos(v3_rot[i1])
-	#Circular, Non-Repeated Axes
-    #XYZ, YZX, ZXY
-    elif (i1 == 0 and i2 == 1 and i3 == 2) or   \
-    (i1 == 1 and i2 == 2 and i3 == 0) or        \
-    (i1 == 2 and i2 == 0 and i3 == 1):
+    elif family == 3:   #Circular, Non-Repeated Axes (XYZ, YZX, ZXY)
         out[0] = math.atan2(-v3_rot[i1n], v3_rot[i1nn])
         out[1] = math.asin(v3_rot[i1]) #Note, the paper incorrectly says -asin
     else:
@@ -272,17 +313,13 @@ def q2ea(in_quat: list[float], order: list[int]) -> list[float]:
     #(Rotating along Axis 3 does not change the position of Axis 3, this is done to obtain an axis that will be rotated
     #so that the difference can be computed to decide how much rotation is needed for the last angle)
     i3n = (i3 + 1) % 3
-    v3n = [0, 0, 0]
-    v3n[i3n] = 1
+    v3n = _UNIT_AXES[i3n]
 
-    v3_q12 = v3n.copy()
-    v3_q = v3n.copy()
-    v3_q12 = quat_rotate_vec(q12, v3_q12)
-    v3_q = quat_rotate_vec(in_quat, v3_q)
+    v3_q12 = list(_rotate_vec_scalars(*q12, *v3n))
+    v3_q = list(_rotate_vec_scalars(*in_quat, *v3n))
 
     #Now do trig to figure out how much rotation, and what direction, is needed to rotate v3_q12 to v3_q
-    d = _vec.vec_dot(v3_q12, v3_q) #Get angle between the two, ensure in range of acos
-    d = max(-1, min(1, d))
+    d = _clamp11(_vec.vec_dot(v3_q12, v3_q)) #Get angle between the two, ensure in range of acos
     magnitude = math.acos(d)
 
     #Determine the sign of the rotation
@@ -295,7 +332,8 @@ def q2ea(in_quat: list[float], order: list[int]) -> list[float]:
 
     return out
 
-def string_order_to_indices(order: str):
+@functools.lru_cache(maxsize=32)
+def _string_order_to_indices(order: str) -> tuple[int, ...]:
     order = order.lower()
     int_order = []
     if len(order) != 3: raise ValueError()
@@ -304,35 +342,87 @@ def string_order_to_indices(order: str):
         elif c == 'y': int_order.append(1)
         elif c == 'z': int_order.append(2)
         else: raise ValueError()
-    
-    return int_order
 
-def quat_to_euler_angles(in_quat: list[float], order: str|list[int], extrinsic=False):
-    if isinstance(order, str):
-        if 'e' in order.lower():
-            extrinsic = True
-        elif 'i' in order.lower():
-            extrinsic = False
-        #Only care about the first 3 chars, the 4th optional char is extrinsic vs intrinsic
-        order = string_order_to_indices(order[:3])
-    
-    #Extrinsic is performing the rotations around the axes of the original fixed system (Rotates around world axes)
-    #Intrinsic is performing the rotations around the axes of a coordinate system that rotates with each step (It rotates around the local axes of the rotating object).
-    #These two representations are very similar, and even related. An extrinsic rotation is the same as an intrinsic rotation by the same angles, but with the order inverted.
+    return tuple(int_order)
+
+def string_order_to_indices(order: str):
+    #Fresh list per call since callers may modify the result; the parse itself is cached
+    return list(_string_order_to_indices(order))
+
+#Extrinsic is performing the rotations around the axes of the original fixed system (Rotates around world axes)
+#Intrinsic is performing the rotations around the axes of a coordinate system that rotates with each step (It rotates around the local axes of the rotating object).
+#These two representations are very similar, and even related. An extrinsic rotation is the same as an intrinsic rotation by the same angles, but with the order inverted.
+@functools.lru_cache(maxsize=32)
+def _parse_euler_spec(order: str, extrinsic: bool) -> tuple[tuple[int, ...], bool]:
+    """Resolve an Euler order string to (q2ea index order, extrinsic flag), with
+    the extrinsic order reversal already applied."""
+    lowered = order.lower()
+    if 'e' in lowered:
+        extrinsic = True
+    elif 'i' in lowered:
+        extrinsic = False
+    #Only care about the first 3 chars, the 4th optional char is extrinsic vs intrinsic
+    indices = _string_order_to_indices(lowered[:3])
     if extrinsic:
         #Taking advantage of the above info that intrinsic = extrinsic but in reverse and vice versa.
-        order[0], order[2] = order[2], order[0]
-    
+        indices = (indices[2], indices[1], indices[0])
+    return indices, extrinsic
+
+def quat_to_euler_angles(in_quat: list[float], order: str|list[int], extrinsic=False):
+    if isinstance(order, str):
+        order, extrinsic = _parse_euler_spec(order, extrinsic)
+    elif extrinsic:
+        order = (order[2], order[1], order[0])
+
     #Actual conversion, everything else is just setup
     angles = q2ea(in_quat, order)
 
     if extrinsic:
         #Swap back to the original desired order
         angles[0], angles[2] = angles[2], angles[0]
-    
+
     return angles
 
+#Right-multiplies quat (x, y, z, w) by a rotation of s/c = sin/cos of the half
+#angle about a single base axis. The axis quat only has two nonzero components,
+#so this is 8 mults instead of quat_mul's 16 (and no list allocations).
+def _quat_mul_axis(x, y, z, w, axis, s, c):
+    if axis == 0:
+        return w*s + x*c, y*c + z*s, z*c - y*s, w*c - x*s
+    if axis == 1:
+        return x*c - z*s, w*s + y*c, z*c + x*s, w*c - y*s
+    return x*c + y*s, y*c - x*s, w*s + z*c, w*c - z*s
+
 def angles_to_quaternion(angles: list[float], order: str|list[int], degrees=True, extrinsic=False):
+    if len(angles) == 3:
+        #Common case: fuse the three sparse axis quats directly instead of
+        #going through axis_to_unit_vector/quat_from_axis_angle/quat_mul
+        if isinstance(order, str):
+            #Only the first 3 chars name axes; the loop below likewise never
+            #indexes past the angle count, so longer strings stay accepted
+            i0, i1, i2 = _string_order_to_indices(order[:3])
+        else:
+            i0, i1, i2 = (i if not isinstance(i, str) else ord(i.lower()) - ord('x') for i in order)
+        a0, a1, a2 = angles
+        if degrees:
+            a0 = math.radians(a0)
+            a1 = math.radians(a1)
+            a2 = math.radians(a2)
+        if extrinsic:
+            #q2*q1*q0 is the same as applying the axes in reverse with right-multiplies
+            i0, i1, i2 = i2, i1, i0
+            a0, a1, a2 = a2, a1, a0
+        h = a0 * 0.5
+        x = y = z = 0.0
+        w = math.cos(h)
+        if i0 == 0: x = math.sin(h)
+        elif i0 == 1: y = math.sin(h)
+        else: z = math.sin(h)
+        h = a1 * 0.5
+        x, y, z, w = _quat_mul_axis(x, y, z, w, i1, math.sin(h), math.cos(h))
+        h = a2 * 0.5
+        x, y, z, w = _quat_mul_axis(x, y, z, w, i2, math.sin(h), math.cos(h))
+        return [x, y, z, w]
     quat = [0, 0, 0, 1]
     for i in range(len(angles)):
         axis = order[i]
@@ -358,14 +448,64 @@ def slerp(a, b, t):
     dot = _vec.vec_dot(a, b)
     if dot < 0: #To force it to be the shortest route
         b = [-v for v in b]
+        dot = -dot
 
+    dot = min(1.0, dot) #Floating point can give values like 1.0000002 which NAN in acos
     theta = math.acos(dot)
     sin_theta = math.sin(theta)
-    r1 = math.sin(1 - t) * theta / sin_theta
+    if sin_theta < 1e-9:
+        #Nearly parallel quaternions, lerp + normalize avoids the divide blowup
+        return _vec.vec_normalize([va + (vb - va) * t for va, vb in zip(a, b)])
+    r1 = math.sin((1 - t) * theta) / sin_theta
     r2 = math.sin(t * theta) / sin_theta
-    a = [r1 * v for v in a]
-    b = [r2 * v for v in b]
-    return _vec.vec_normalize([v + w for v, w in zip(a, b)])
+    return _vec.vec_normalize([r1 * va + r2 * vb for va, vb in zip(a, b)])
+
+def slerp_batch(a, b, ts):
+    """
+    Slerp between the same two quaternions at many interpolation factors,
+    computing the shared angle setup once instead of per sample.
+
+    Parameters
+    ----------
+    a, b : list[float]
+        The endpoint quaternions in XYZW format
+    ts : list[float] or numpy.ndarray
+        The interpolation factors
+
+    Returns
+    -------
+    list[list[float]] or numpy.ndarray
+        One interpolated unit quaternion per factor, matching the container
+        type of ts
+    """
+    dot = _vec.vec_dot(a, b)
+    if dot < 0: #To force it to be the shortest route
+        b = [-v for v in b]
+        dot = -dot
+    dot = min(1.0, dot)
+    theta = math.acos(dot)
+    sin_theta = math.sin(theta)
+
+    if _np is not None and isinstance(ts, _np.ndarray):
+        av = _np.asarray(a, dtype=float)
+        bv = _np.asarray(b, dtype=float)
+        if sin_theta < 1e-9:
+            out = av + (bv - av) * ts[:, None]
+        else:
+            r1 = _np.sin((1 - ts) * theta) / sin_theta
+            r2 = _np.sin(ts * theta) / sin_theta
+            out = r1[:, None] * av + r2[:, None] * bv
+        return out / _np.linalg.norm(out, axis=1, keepdims=True)
+
+    if sin_theta < 1e-9:
+        return [_vec.vec_normalize([va + (vb - va) * t for va, vb in zip(a, b)]) for t in ts]
+    inv_sin_theta = 1.0 / sin_theta
+    out = []
+    for t in ts:
+        r1 = math.sin((1 - t) * theta) * inv_sin_theta
+        r2 = math.sin(t * theta) * inv_sin_theta
+        out.append(_vec.vec_normalize([r1 * va + r2 * vb for va, vb in zip(a, b)]))
+    return out
 
 #-------------------------------DEPRECATED FUNCTIONS-------------------------------
 
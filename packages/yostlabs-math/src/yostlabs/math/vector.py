@@ -1,7 +1,17 @@
 def vec_len(vector: list[float|int]):
+    #Unrolled for the 3/4 element vectors the quaternion hot paths use
+    if len(vector) == 3:
+        return (vector[0]*vector[0] + vector[1]*vector[1] + vector[2]*vector[2]) ** 0.5
+    if len(vector) == 4:
+        return (vector[0]*vector[0] + vector[1]*vector[1] + vector[2]*vector[2] + vector[3]*vector[3]) ** 0.5
     return sum(v ** 2 for v in vector) ** 0.5
 
 def vec_dot(a: list[float], b: list[float]):
+    #Unrolled for the 3/4 element vectors the quaternion hot paths use
+    if len(a) == 3:
+        return a[0]*b[0] + a[1]*b[1] + a[2]*b[2]
+    if len(a) == 4:
+        return a[0]*b[0] + a[1]*b[1] + a[2]*b[2] + a[3]*b[3]
     return sum(a[i] * b[i] for i in range(len(a)))
 
 def vec_cross(a: list[float], b: list[float]):
@@ -15,7 +25,8 @@ def vec_normalize(vec: list[float]):
     l = vec_len(vec)
     if l == 0:
         return vec
-    return [v / l for v in vec]
+    inv = 1.0 / l #Single divide, then multiplies
+    return [v * inv for v in vec]
 
 #Backwards compatability, make this available from this file
 from yostlabs.math.axes import axis_to_unit_vector
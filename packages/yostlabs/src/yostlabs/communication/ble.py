@@ -104,6 +104,10 @@ class ThreespaceBLEComClass(ThreespaceComClass):
         self.__timeout = self.DEFAULT_TIMEOUT
 
         self.buffer = bytearray()
+        #Index of the first unread byte. Draining from the front of a bytearray
+        #memmoves the whole tail, so reads just advance this head and the drained
+        #prefix is discarded periodically instead of on every read.
+        self.__head = 0
         self.data_read_event: asyncio.Event = None
 
         #Default to 20, will update on open
@@ -146,6 +150,7 @@ class ThreespaceBLEComClass(ThreespaceComClass):
         await self.client.disconnect()
         self.data_read_event = None
         self.buffer.clear()
+        self.__head = 0
 
     def close(self):
         if not self.__opened: return
@@ -156,8 +161,8 @@ class ThreespaceBLEComClass(ThreespaceComClass):
         self.__connected = False
 
     #Goal is that this is always called after something that would have already performed an async callback
-    #to prevent needing to run the event loop. Running the event loop frequently is slow. Which is also why this
-    #comclass will eventually have a threaded asyncio version.
+    #to prevent needing to run the event loop. All async work runs on the shared EVENT_LOOP thread and is
+    #submitted via run_coroutine_threadsafe, so each operation costs one submit instead of spinning up a loop.
     def __assert_connected(self):
         if not self.__connected and self.error_on_disconnect:
             raise TssBLENoConnectionError(f"{self.name} is not connected")
@@ -168,81 +173,109 @@ class ThreespaceBLEComClass(ThreespaceComClass):
         return self.__connected
 
     def __on_data_received(self, sender: BleakGATTCharacteristic, data: bytearray):
-        self.buffer += data
+        #extend guarantees in-place growth regardless of whether bleak hands us bytes or bytearray
+        self.buffer.extend(data)
         self.data_read_event.set()
 
+    async def __async_write(self, data: bytes):
+        view = memoryview(data) #Zero-copy slicing of the fragments
+        for start_index in range(0, len(data), self.max_packet_size): #Can only send max_packet_size data per call to write_gatt_char
+            await self.client.write_gatt_char(self.profile.RX_UUID, view[start_index:start_index + self.max_packet_size], response=False)
+
     def write(self, bytes: bytes):
-        start_index = 0
-        while start_index < len(bytes):
-            end_index = min(len(bytes), start_index + self.max_packet_size) #Can only send max_packet_size data per call to write_gatt_char
-            asyncio.run_coroutine_threadsafe(
-                self.client.write_gatt_char(self.profile.RX_UUID, bytes[start_index:end_index], response=False),
-                self.EVENT_LOOP).result()
-            start_index = end_index
+        #Submit all the fragments as one coroutine instead of paying the
+        #thread round trip to the event loop once per fragment
+        asyncio.run_coroutine_threadsafe(self.__async_write(bytes), self.EVENT_LOOP).result()
     
-    async def __await_read(self, timeout_time: int):
+    async def __await_read(self):
         self.__assert_connected()
-        try:
-            async with async_timeout.timeout_at(timeout_time):
-                await self.data_read_event.wait()
-            self.data_read_event.clear()
-            return True
-        except:
-            return False
+        await self.data_read_event.wait()
+        self.data_read_event.clear()
 
     async def __await_num_bytes(self, num_bytes: int):
-        start_time = self.EVENT_LOOP.time()
-        while len(self.buffer) < num_bytes and self.EVENT_LOOP.time() - start_time < self.timeout:
-            await self.__await_read(start_time + self.timeout)
+        if len(self.buffer) - self.__head >= num_bytes: return
+        #A single timeout context covers the whole wait instead of checking the
+        #clock on every notification wakeup
+        try:
+            async with async_timeout.timeout(self.timeout):
+                while len(self.buffer) - self.__head < num_bytes:
+                    await self.__await_read()
+        except asyncio.TimeoutError:
+            pass
+
+    #Discard the drained prefix once it is large enough that the memmove cost is amortized
+    __COMPACT_THRESHOLD = 65536
+    def __compact(self):
+        if self.__head > self.__COMPACT_THRESHOLD or self.__head > len(self.buffer) // 2:
+            del self.buffer[:self.__head]
+            self.__head = 0
 
     def read(self, num_bytes: int):
         asyncio.run_coroutine_threadsafe(self.__await_num_bytes(num_bytes), self.EVENT_LOOP).result()
-        num_bytes = min(num_bytes, len(self.buffer))
-        data = self.buffer[:num_bytes]
-        del self.buffer[:num_bytes]
+        num_bytes = min(num_bytes, len(self.buffer) - self.__head)
+        data = self.buffer[self.__head:self.__head + num_bytes]
+        self.__head += num_bytes
+        self.__compact()
         return data
 
     def peek(self, num_bytes: int):
         asyncio.run_coroutine_threadsafe(self.__await_num_bytes(num_bytes), self.EVENT_LOOP).result()
-        num_bytes = min(num_bytes, len(self.buffer))
-        data = self.buffer[:num_bytes]
-        return data        
-    
-    #Reads until the pattern is received, max_length is exceeded, or timeout occurs
+        num_bytes = min(num_bytes, len(self.buffer) - self.__head)
+        data = self.buffer[self.__head:self.__head + num_bytes]
+        return data
+
+    #Waits until the pattern is received, max_length is exceeded, or timeout occurs.
+    #Returns the index of the pattern in the buffer, or -1 if it was not found.
     async def __await_pattern(self, pattern: bytes, max_length: int = None):
         if max_length is None: max_length = float('inf')
-        start_time = self.EVENT_LOOP.time()
-        while pattern not in self.buffer and self.EVENT_LOOP.time() - start_time < self.timeout and len(self.buffer) < max_length:
-            await self.__await_read(start_time + self.timeout)
-        return pattern in self.buffer
+        scan_pos = self.__head
+        index = -1
+        try:
+            async with async_timeout.timeout(self.timeout):
+                while True:
+                    #Only scan the bytes that arrived since the last pass, backing up
+                    #enough to catch a pattern straddling the previous boundary
+                    index = self.buffer.find(pattern, max(self.__head, scan_pos - len(pattern) + 1))
+                    if index != -1:
+                        break
+                    scan_pos = len(self.buffer)
+                    if scan_pos - self.__head >= max_length:
+                        break
+                    await self.__await_read()
+        except asyncio.TimeoutError:
+            #Data may have arrived between the last scan and the timeout firing
+            index = self.buffer.find(pattern, max(self.__head, scan_pos - len(pattern) + 1))
+        return index
 
     def read_until(self, expected: bytes) -> bytes:
-        asyncio.run_coroutine_threadsafe(self.__await_pattern(expected), self.EVENT_LOOP).result()
-        if expected in self.buffer: #Found the pattern
-            length = self.buffer.index(expected) + len(expected)
-            result = self.buffer[:length]
-            del self.buffer[:length]
+        index = asyncio.run_coroutine_threadsafe(self.__await_pattern(expected), self.EVENT_LOOP).result()
+        if index != -1: #Found the pattern
+            end = index + len(expected)
+            result = self.buffer[self.__head:end]
+            self.__head = end
+            self.__compact()
             return result
         #Failed to find the pattern, just return whatever is there
-        result = self.buffer.copy()
+        result = self.buffer[self.__head:]
         self.buffer.clear()
+        self.__head = 0
         return result
 
     def peek_until(self, expected: bytes, max_length: int = None) -> bytes:
-        asyncio.run_coroutine_threadsafe(self.__await_pattern(expected, max_length=max_length), self.EVENT_LOOP).result()
-        if expected in self.buffer:
-            length = self.buffer.index(expected) + len(expected)
+        index = asyncio.run_coroutine_threadsafe(self.__await_pattern(expected, max_length=max_length), self.EVENT_LOOP).result()
+        if index != -1:
+            length = index + len(expected) - self.__head
         else:
-            length = len(self.buffer)
+            length = len(self.buffer) - self.__head
 
         if max_length is not None and length > max_length:
             length = max_length
 
-        return self.buffer[:length]
+        return self.buffer[self.__head:self.__head + length]
 
     @property
     def length(self):
-        return len(self.buffer) 
+        return len(self.buffer) - self.__head
 
     @property
     def timeout(self) -> float:
@@ -351,7 +384,7 @@ class ThreespaceBLEComClass(ThreespaceComClass):
     @classmethod
     def __detection_callback(cls, device: BLEDevice, adv: AdvertisementData):
         with cls.SCANNER_LOCK:
-            cls.discovered_devices[device.address] = {"device": device, "adv": adv, "last_found": time.perf_counter()}
+            cls.discovered_devices[device.address] = {"device": device, "adv": adv, "last_found": time.monotonic()}
     
     @classmethod
     async def __async_start_scanner(cls):
@@ -401,24 +434,21 @@ class ThreespaceBLEComClass(ThreespaceComClass):
         cls.__lazy_init_scanner()
         if cls.SCANNER_CONTINOUS:
             with cls.SCANNER_LOCK:
-                #Remove expired devices
-                cur_time = time.perf_counter()
-                to_remove = [] #Avoiding concurrent list modification
-                for device in cls.discovered_devices:
-                    if cur_time - cls.discovered_devices[device]["last_found"] > cls.SCANNER_EXPIRATION_TIME:
-                        to_remove.append(device) 
-                for device in to_remove:
-                    del cls.discovered_devices[device]
+                #Remove expired devices. Only rebuild the dict when something actually
+                #expired so the steady-state pass is a single scan with no allocations.
+                expire_before = time.monotonic() - cls.SCANNER_EXPIRATION_TIME
+                if any(info["last_found"] < expire_before for info in cls.discovered_devices.values()):
+                    cls.discovered_devices = {address: info for address, info in cls.discovered_devices.items()
+                                              if info["last_found"] >= expire_before}
                 discovered = cls.discovered_devices.copy()
         else:
             #Mark all devices as invalid before searching for nearby devices
             cls.discovered_devices.clear()
-            start_time = time.perf_counter()
-            end_time = cls.SCANNER_TIMEOUT or float('inf')
+            deadline = time.monotonic() + (cls.SCANNER_TIMEOUT or float('inf')) #Compute the deadline once instead of per iteration
             end_count = cls.SCANNER_FIND_COUNT or float('inf')
             asyncio.run_coroutine_threadsafe(cls.SCANNER.start(), cls.EVENT_LOOP).result()
-            while time.perf_counter() - start_time < end_time and len(cls.discovered_devices) < end_count:
-                time.sleep(0)
+            while time.monotonic() < deadline and len(cls.discovered_devices) < end_count:
+                time.sleep(0.01) #Yield for real instead of burning a core with sleep(0)
             asyncio.run_coroutine_threadsafe(cls.SCANNER.stop(), cls.EVENT_LOOP).result()
             discovered = cls.discovered_devices.copy()
         return discovered
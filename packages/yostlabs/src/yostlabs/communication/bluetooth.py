@@ -1,4 +1,5 @@
 from yostlabs.communication.socket import ThreespaceSocketComClass
+import functools
 import time
 import threading
 import sys
@@ -26,79 +27,87 @@ class COD:
     services: list[str]
     major_class: str
     minor_class: str
-
-def decode_class_of_device(cod: int) -> dict:
+    minor_code: int #The raw minor class bits, for filtering without string compares
+
+# Service Class bit masks (11 bits total)
+_COD_SERVICES = {
+    0x002000: "Limited Discoverable Mode",
+    0x004000: "Positioning (Location Identification)",
+    0x008000: "Networking",
+    0x010000: "Rendering",
+    0x020000: "Capturing",
+    0x040000: "Object Transfer",
+    0x080000: "Audio",
+    0x100000: "Telephony",
+    0x200000: "Information",
+}
+# Major Device Classes (5 bits)
+_COD_MAJOR_CLASSES = {
+    0x00: "Miscellaneous",
+    0x01: "Computer",
+    0x02: "Phone",
+    0x03: "LAN/Network Access Point",
+    0x04: "Audio/Video",
+    0x05: "Peripheral",
+    0x06: "Imaging",
+    0x07: "Wearable",
+    0x08: "Toy",
+    0x09: "Health",
+    0x1F: "Uncategorized",
+}
+
+# Minor Class mappings for some major classes (for simplicity)
+_COD_MINOR_CLASSES = {
+    0x01: {
+        0x00: "Uncategorized",
+        0x01: "Desktop workstation",
+        0x02: "Server-class computer",
+        0x03: "Laptop",
+        0x04: "Handheld PC/PDA",
+        0x05: "Palm-size PC/PDA",
+    },
+    0x02: {
+        0x00: "Uncategorized",
+        0x01: "Cellular",
+        0x02: "Cordless",
+        0x03: "Smartphone",
+        0x04: "Wired modem or voice gateway",
+        0x05: "Common ISDN access",
+    },
+    0x05: {
+        0x00: "Uncategorized",
+        0x01: "Keyboard",
+        0x02: "Pointing device",
+        0x03: "Combo keyboard/pointing device",
+    },
+}
+
+#Scanners report the same CoD value for a device on every pass, so cache the decodes
+@functools.lru_cache(maxsize=256)
+def decode_class_of_device(cod: int) -> COD:
     """Decode a Bluetooth Class of Device (CoD) integer into its components."""
-
-    # Service Class bit masks (11 bits total)
-    services = {
-        0x002000: "Limited Discoverable Mode",
-        0x004000: "Positioning (Location Identification)",
-        0x008000: "Networking",
-        0x010000: "Rendering",
-        0x020000: "Capturing",
-        0x040000: "Object Transfer",
-        0x080000: "Audio",
-        0x100000: "Telephony",
-        0x200000: "Information",
-    }
-
-    # Major Device Classes (5 bits)
-    major_classes = {
-        0x00: "Miscellaneous",
-        0x01: "Computer",
-        0x02: "Phone",
-        0x03: "LAN/Network Access Point",
-        0x04: "Audio/Video",
-        0x05: "Peripheral",
-        0x06: "Imaging",
-        0x07: "Wearable",
-        0x08: "Toy",
-        0x09: "Health",
-        0x1F: "Uncategorized",
-    }
-
-    # Minor Class mappings for some major classes (for simplicity)
-    minor_classes = {
-        0x01: {
-            0x00: "Uncategorized",
-            0x01: "Desktop workstation",
-            0x02: "Server-class computer",
-            0x03: "Laptop",
-            0x04: "Handheld PC/PDA",
-            0x05: "Palm-size PC/PDA",
-        },
-        0x02: {
-            0x00: "Uncategorized",
-            0x01: "Cellular",
-            0x02: "Cordless",
-            0x03: "Smartphone",
-            0x04: "Wired modem or voice gateway",
-            0x05: "Common ISDN access",
-        },
-        0x05: {
-            0x00: "Uncategorized",
-            0x01: "Keyboard",
-            0x02: "Pointing device",
-            0x03: "Combo keyboard/pointing device",
-        },
-    }
-
     # Extract fields
     service_bits = cod & 0xFFE000  # top 11 bits
     major_class = (cod >> 8) & 0x1F
     minor_class = (cod >> 2) & 0x3F
 
-    # Decode services
-    decoded_services = [name for bit, name in services.items() if service_bits & bit]
+    # Decode services by peeling set bits, so only bits actually present cost anything
+    decoded_services = []
+    bits = service_bits
+    while bits:
+        lsb = bits & -bits
+        name = _COD_SERVICES.get(lsb)
+        if name is not None: #Reserved bits in the 11-bit field have no name
+            decoded_services.append(name)
+        bits ^= lsb
 
-    # Decode major class
-    major_name = major_classes.get(major_class, "Unknown")
+    # Decode major class (interned so filter equality checks are pointer compares)
+    major_name = sys.intern(_COD_MAJOR_CLASSES.get(major_class, "Unknown"))
 
     # Decode minor class (context-dependent)
-    minor_name = minor_classes.get(major_class, {}).get(minor_class, f"Minor code {minor_class}")
+    minor_name = _COD_MINOR_CLASSES.get(major_class, {}).get(minor_class, f"Minor code {minor_class}")
 
-    return COD(cod, decoded_services or ["None"], major_name, minor_name)
+    return COD(cod, decoded_services or ["None"], major_name, minor_name, minor_class)
 
 @dataclass
 class ScannerResult:
@@ -117,11 +126,15 @@ class Scanner:
         self.nearby = None          #The list of nearby devices
         self.thread = None          #The thread running the asynchronous scanner
         self.updated = False        #Set to true when self.nearby has been updated
+        self.update_event = threading.Event()   #Signaled whenever a scan pass publishes new results, so waiters don't have to poll
+        self.__result_cache: dict[str, tuple[str, int, ScannerResult]] = {} #Reuse results for devices unchanged between scans
+        self.__wake_event = threading.Event()   #Wakes the scan thread when there is work (or it should exit) instead of spinning
         self.duration = math.ceil(desired_scan_time / 1.28) * 1.28  #The time, in second, each scan lasts. Scanning is in 1.28 second intervals, so this may differ from the desired scan time
 
     def start(self):
         if not self.done:
             self.execute = True
+            self.__wake_event.set()
             return
         self.thread = threading.Thread(target=self.process, daemon=True)
         self.enabled = True
@@ -131,15 +144,28 @@ class Scanner:
 
     def stop(self):
         self.enabled = False
+        self.__wake_event.set()
 
     def set_continous(self, continous: bool):
         self.continous = continous
+        if continous:
+            self.__wake_event.set()
 
     def get_most_recent(self):
         if not self.updated: return None
         self.updated = False
         return self.nearby
 
+    def wait_for_update(self, timeout: float = None):
+        """
+        Blocks until the next scan pass publishes results (or timeout, in seconds,
+        elapses). Returns True if an update occurred.
+        """
+        result = self.update_event.wait(timeout)
+        if result:
+            self.update_event.clear()
+        return result
+
     @property
     def is_running(self):
         return self.done
@@ -148,11 +174,28 @@ class Scanner:
         if not BLUETOOTH_AVAILABLE:
             raise ImportError("pybluez2 is not installed. Install it with: pip install git+https://github.com/airgproducts/pybluez2.git")
         while self.enabled:
-            if not self.continous and not self.execute: continue
+            if not self.continous and not self.execute:
+                #Sleep until start()/stop()/set_continous signals there is something to do
+                self.__wake_event.wait()
+                self.__wake_event.clear()
+                continue
             nearby = bluetooth.discover_devices(duration=math.ceil(self.duration/1.28), lookup_names=True, lookup_class=True)
-            self.nearby = [ScannerResult(addr, name, decode_class_of_device(cod)) for addr, name, cod in nearby]
+            #Only build new results for devices whose (name, cod) changed since the last pass
+            cache = {}
+            results = []
+            for addr, name, cod in nearby:
+                prev = self.__result_cache.get(addr)
+                if prev is not None and prev[0] == name and prev[1] == cod:
+                    result = prev[2]
+                else:
+                    result = ScannerResult(addr, name, decode_class_of_device(cod))
+                cache[addr] = (name, cod, result)
+                results.append(result)
+            self.__result_cache = cache #Also drops devices no longer nearby
+            self.nearby = results
             self.execute = False
             self.updated = True
+            self.update_event.set()
         self.done = True
 
 if sys.platform == "win32":
@@ -218,7 +261,7 @@ class ThreespaceBluetoothComClass(ThreespaceSocketComClass):
 
     @staticmethod
     def __default_filter(result: ScannerResult):
-        return result.class_of_device.major_class == "Wearable" and result.class_of_device.minor_class == "Minor code 0"
+        return result.class_of_device.major_class == "Wearable" and result.class_of_device.minor_code == 0
 
     @staticmethod
     def auto_detect(wait_for_update=True, filter: Callable[[ScannerResult],bool] = None) -> Generator["ThreespaceBluetoothComClass", None, None]:
@@ -229,10 +272,12 @@ class ThreespaceBluetoothComClass(ThreespaceSocketComClass):
         cls.__lazy_init_scanner()
         if filter is None: 
             filter = cls.__default_filter
-        cls.SCANNER.start()
         if wait_for_update:
             cls.SCANNER.updated = False
-            while not cls.SCANNER.updated: time.sleep(0.1)
+            cls.SCANNER.update_event.clear()
+        cls.SCANNER.start()
+        if wait_for_update:
+            cls.SCANNER.wait_for_update()
         if cls.SCANNER.nearby is None: return
         for device_info in cls.SCANNER.nearby:
             if not filter(device_info): continue
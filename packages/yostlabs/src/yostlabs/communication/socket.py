@@ -1,4 +1,5 @@
 from yostlabs.communication.base import *
+import select
 import socket
 import time
 from typing import Callable
@@ -15,6 +16,10 @@ class ThreespaceSocketComClass(ThreespaceComClass):
         self._opened = False
 
         self.buffer = bytearray()
+        #Index of the first unread byte. Draining the front of a bytearray with
+        #del memmoves the whole tail, so reads advance this head instead and the
+        #drained prefix is discarded periodically.
+        self.__head = 0
         self.__timeout = 2
         self.__connection_timeout = connection_timeout
         self.__connection_params = connection_params
@@ -35,6 +40,9 @@ class ThreespaceSocketComClass(ThreespaceComClass):
             else:
                 self.socket.settimeout(self.__connection_timeout)
             self.socket.connect(*self.__connection_params)
+            #Non-blocking from here on out. select handles all waiting, so recv
+            #never needs the blocking mode toggled per call.
+            self.socket.setblocking(False)
         except Exception as e:
             try:
                 self.socket.close()
@@ -53,65 +61,113 @@ class ThreespaceSocketComClass(ThreespaceComClass):
         return self._opened
 
     def write(self, bytes: bytes):
-        self.socket.send(bytes)
+        #The socket is non-blocking, so send may be partial. Loop over a
+        #memoryview, waiting in select for writability when the buffer is full.
+        view = memoryview(bytes)
+        deadline = time.perf_counter() + self.timeout
+        while view:
+            try:
+                sent = self.socket.send(view)
+            except BlockingIOError:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    raise socket.timeout("timed out")
+                select.select([], [self.socket], [], remaining)
+                continue
+            view = view[sent:]
+            deadline = time.perf_counter() + self.timeout #Progress was made, rearm
+
+    #Discard the drained prefix once it is large enough that the memmove cost is amortized
+    __COMPACT_THRESHOLD = 4096
+    def __compact(self):
+        if self.__head > self.__COMPACT_THRESHOLD or self.__head > len(self.buffer) // 2:
+            del self.buffer[:self.__head]
+            self.__head = 0
 
     def read(self, num_bytes: int):
-        self.__update_while(lambda: len(self.buffer) < num_bytes)
-        amount = min(len(self.buffer), num_bytes)
-        result = self.buffer[:amount]
-        del self.buffer[:amount]
+        self.__update_while(lambda: len(self.buffer) - self.__head < num_bytes)
+        amount = min(len(self.buffer) - self.__head, num_bytes)
+        result = self.buffer[self.__head:self.__head + amount]
+        self.__head += amount
+        self.__compact()
         return result
-    
+
     def peek(self, num_bytes: int):
-        self.__update_while(lambda: len(self.buffer) < num_bytes)
-        amount = min(len(self.buffer), num_bytes)
-        return self.buffer[:amount]
-        
+        self.__update_while(lambda: len(self.buffer) - self.__head < num_bytes)
+        amount = min(len(self.buffer) - self.__head, num_bytes)
+        return self.buffer[self.__head:self.__head + amount]
+
+    #Waits until the pattern is received, max_length is exceeded, or timeout occurs.
+    #Returns the index of the pattern in the buffer, or -1 if it was not found.
+    #Only newly received bytes are scanned on each pass, backing up enough to
+    #catch a pattern straddling a recv boundary.
+    def __update_until_pattern(self, expected: bytes, max_length: int = None):
+        deadline = time.perf_counter() + self.timeout
+        search_from = self.__head
+        while True:
+            index = self.buffer.find(expected, search_from)
+            if index != -1:
+                return index
+            search_from = max(self.__head, len(self.buffer) - len(expected) + 1)
+            if max_length is not None and len(self.buffer) - self.__head >= max_length:
+                return -1
+            #Always attempt at least a zero-wait drain so timeout=0 still
+            #behaves as a poll of data already pending in the OS buffer
+            remaining = deadline - time.perf_counter()
+            if not self.__update_buffer(wait_time=max(0.0, remaining)) and remaining <= 0:
+                return -1
+
     def read_until(self, expected: bytes):
-        self.__update_while(lambda: expected not in self.buffer)
-        if expected in self.buffer:
-            length = self.buffer.index(expected) + len(expected)
-            result = self.buffer[:length]
-            del self.buffer[:length]
+        index = self.__update_until_pattern(expected)
+        if index != -1:
+            end = index + len(expected)
+            result = self.buffer[self.__head:end]
+            self.__head = end
+            self.__compact()
         else:
-            result = self.buffer.copy()
+            result = self.buffer[self.__head:]
             self.buffer.clear()
+            self.__head = 0
         return result
-    
+
     def peek_until(self, expected: bytes, max_length: int = None):
-        self.__update_while(lambda: expected not in self.buffer and (max_length is None or len(self.buffer) < max_length))
-        if expected in self.buffer:
-            length = self.buffer.index(expected) + len(expected)
-            if max_length is not None:
-                length = min(length, max_length)
-            result = self.buffer[:length]
+        index = self.__update_until_pattern(expected, max_length=max_length)
+        if index != -1:
+            length = index + len(expected) - self.__head
         else:
-            length = len(self.buffer)
-            if max_length is not None:
-                length = min(length, max_length)
-            result = self.buffer[:length]
-        return result
+            length = len(self.buffer) - self.__head
+        if max_length is not None:
+            length = min(length, max_length)
+        return self.buffer[self.__head:self.__head + length]
 
     def __update_while(self, condition: Callable):
-        start_time = time.perf_counter()
+        deadline = time.perf_counter() + self.timeout
         while condition():
-            self.__update_buffer()
-            if time.perf_counter() - start_time >= self.timeout:
+            #Always attempt at least a zero-wait drain so timeout=0 still
+            #behaves as a poll of data already pending in the OS buffer
+            remaining = deadline - time.perf_counter()
+            if not self.__update_buffer(wait_time=max(0.0, remaining)) and remaining <= 0:
                 return
 
-    def __update_buffer(self, max_bytes: int = 1000):
-        self.socket.setblocking(False)
+    def __update_buffer(self, max_bytes: int = 65536, wait_time: float = 0):
+        #Sleep in select until data is available (or wait_time expires) instead of
+        #spinning on recv, then pull everything pending in one large read
+        ready, _, _ = select.select([self.socket], [], [], wait_time)
+        if not ready:
+            return False
         try:
-            self.buffer += self.socket.recv(max_bytes)
+            data = self.socket.recv(max_bytes)
         except BlockingIOError:
             return False
-        self.socket.settimeout(self.timeout)
+        if not data:
+            return False
+        self.buffer += data
         return True
 
     @property
     def length(self):
         while self.__update_buffer(): pass
-        return len(self.buffer)
+        return len(self.buffer) - self.__head
 
     @property
     def reenumerates(self) -> bool:
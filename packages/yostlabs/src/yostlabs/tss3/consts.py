@@ -1,76 +1,79 @@
-THREESPACE_HEADER_STATUS_BIT_POS = 0
-THREESPACE_HEADER_TIMESTAMP_BIT_POS = 1
-THREESPACE_HEADER_ECHO_BIT_POS = 2
-THREESPACE_HEADER_CHECKSUM_BIT_POS = 3
-THREESPACE_HEADER_SERIAL_BIT_POS = 4
-THREESPACE_HEADER_LENGTH_BIT_POS = 5
-THREESPACE_HEADER_NUM_BITS = 6
+from functools import lru_cache
+from typing import Final, NamedTuple
 
-THREESPACE_HEADER_STATUS_BIT = (1 << THREESPACE_HEADER_STATUS_BIT_POS)
-THREESPACE_HEADER_TIMESTAMP_BIT = (1 << THREESPACE_HEADER_TIMESTAMP_BIT_POS)
-THREESPACE_HEADER_ECHO_BIT = (1 << THREESPACE_HEADER_ECHO_BIT_POS)
-THREESPACE_HEADER_CHECKSUM_BIT = (1 << THREESPACE_HEADER_CHECKSUM_BIT_POS)
-THREESPACE_HEADER_SERIAL_BIT = (1 << THREESPACE_HEADER_SERIAL_BIT_POS)
-THREESPACE_HEADER_LENGTH_BIT = (1 << THREESPACE_HEADER_LENGTH_BIT_POS)
+THREESPACE_HEADER_STATUS_BIT_POS: Final[int] = 0
+THREESPACE_HEADER_TIMESTAMP_BIT_POS: Final[int] = 1
+THREESPACE_HEADER_ECHO_BIT_POS: Final[int] = 2
+THREESPACE_HEADER_CHECKSUM_BIT_POS: Final[int] = 3
+THREESPACE_HEADER_SERIAL_BIT_POS: Final[int] = 4
+THREESPACE_HEADER_LENGTH_BIT_POS: Final[int] = 5
+THREESPACE_HEADER_NUM_BITS: Final[int] = 6
 
-THREESPACE_HEADER_FORMAT_CHARS = ['b', 'L', 'B', 'B', 'L', 'H']
+THREESPACE_HEADER_STATUS_BIT: Final[int] = (1 << THREESPACE_HEADER_STATUS_BIT_POS)
+THREESPACE_HEADER_TIMESTAMP_BIT: Final[int] = (1 << THREESPACE_HEADER_TIMESTAMP_BIT_POS)
+THREESPACE_HEADER_ECHO_BIT: Final[int] = (1 << THREESPACE_HEADER_ECHO_BIT_POS)
+THREESPACE_HEADER_CHECKSUM_BIT: Final[int] = (1 << THREESPACE_HEADER_CHECKSUM_BIT_POS)
+THREESPACE_HEADER_SERIAL_BIT: Final[int] = (1 << THREESPACE_HEADER_SERIAL_BIT_POS)
+THREESPACE_HEADER_LENGTH_BIT: Final[int] = (1 << THREESPACE_HEADER_LENGTH_BIT_POS)
 
-FIRMWARE_VALID_BIT = 0x01
+THREESPACE_HEADER_FORMAT_CHARS: Final[list[str]] = ['b', 'L', 'B', 'B', 'L', 'H']
 
-PASSIVE_CALIBRATE_GYRO = (1 << 0)
-PASSIVE_CALIBRATE_MAG_REF = (1 << 1)
+FIRMWARE_VALID_BIT: Final[int] = 0x01
 
-STREAMING_MAX_HZ = 2000
+PASSIVE_CALIBRATE_GYRO: Final[int] = (1 << 0)
+PASSIVE_CALIBRATE_MAG_REF: Final[int] = (1 << 1)
 
-THREESPACE_OUTPUT_MODE_ASCII = 1
-THREESPACE_OUTPUT_MODE_BINARY = 2
+STREAMING_MAX_HZ: Final[int] = 2000
 
-THREESPACE_GET_SETTINGS_ERROR_RESPONSE = "<KEY_ERROR>"
-THREESPACE_BINARY_SETTINGS_ID_SIZE = 4
-THREESPACE_BINARY_READ_SETTINGS_ID = 0xC695B5E1
-THREESPACE_BINARY_WRITE_SETTINGS_ID = 0x822AAE18
+THREESPACE_OUTPUT_MODE_ASCII: Final[int] = 1
+THREESPACE_OUTPUT_MODE_BINARY: Final[int] = 2
 
-THREESPACE_BINARY_WRITE_SETTING_RESPONSE_LEN = 3
-THREESPACE_BINARY_WRITE_SETTING_WITH_HEADER_RESPONSE_LEN = THREESPACE_BINARY_SETTINGS_ID_SIZE + THREESPACE_BINARY_WRITE_SETTING_RESPONSE_LEN
+THREESPACE_GET_SETTINGS_ERROR_RESPONSE: Final[str] = "<KEY_ERROR>"
+THREESPACE_BINARY_SETTINGS_ID_SIZE: Final[int] = 4
+THREESPACE_BINARY_READ_SETTINGS_ID: Final[int] = 0xC695B5E1
+THREESPACE_BINARY_WRITE_SETTINGS_ID: Final[int] = 0x822AAE18
 
-THREESPACE_BINARY_READ_SETTINGS_START_BYTE = 0xFA
-THREESPACE_BINARY_READ_SETTINGS_START_BYTE_HEADER = 0xFC
+THREESPACE_BINARY_WRITE_SETTING_RESPONSE_LEN: Final[int] = 3
+THREESPACE_BINARY_WRITE_SETTING_WITH_HEADER_RESPONSE_LEN: Final[int] = THREESPACE_BINARY_SETTINGS_ID_SIZE + THREESPACE_BINARY_WRITE_SETTING_RESPONSE_LEN
 
-THREESPACE_BINARY_WRITE_SETTINGS_START_BYTE = 0xFB
-THREESPACE_BINARY_WRITE_SETTINGS_START_BYTE_HEADER = 0xFD
+THREESPACE_BINARY_READ_SETTINGS_START_BYTE: Final[int] = 0xFA
+THREESPACE_BINARY_READ_SETTINGS_START_BYTE_HEADER: Final[int] = 0xFC
+
+THREESPACE_BINARY_WRITE_SETTINGS_START_BYTE: Final[int] = 0xFB
+THREESPACE_BINARY_WRITE_SETTINGS_START_BYTE_HEADER: Final[int] = 0xFD
 
 #This is not comprehensive, just enough to separate keys from debug messages
-THREESPACE_SETTING_KEY_INVALID_CHARS = " :;"
-
-THREESPACE_FILE_STREAMING_MAX_PACKET_SIZE = 512
-THREESPACE_LIVE_LOG_STREAM_MAX_PACKET_SIZE = 2048
-
-THREESPACE_MAX_CMD_LEN = 2048
-
-THREESPACE_SN_FAMILY_POS = 14 * 4
-THREESPACE_SN_VARIATION_POS = 11 * 4
-THREESPACE_SN_VERSION_POS = 10 * 4
-THREESPACE_SN_MAJOR_REVISION_POS = 8 * 4
-THREESPACE_SN_MINOR_REVISION_POS = 6 * 4
-THREESPACE_SN_INCREMENTOR_POS = 0 * 4
-
-THREESPACE_SN_FAMILY_MSK = 0xFF << THREESPACE_SN_FAMILY_POS
-THREESPACE_SN_VARIATION_MSK = 0xFFF << THREESPACE_SN_VARIATION_POS
-THREESPACE_SN_VERSION_MSK = 0xF << THREESPACE_SN_VERSION_POS
-THREESPACE_SN_MAJOR_REVISION_MSK = 0xFF << THREESPACE_SN_MAJOR_REVISION_POS
-THREESPACE_SN_MINOR_REVISION_MSK = 0xFF << THREESPACE_SN_MINOR_REVISION_POS
-THREESPACE_SN_INCREMENTOR_MSK = 0xFFFFFF << THREESPACE_SN_INCREMENTOR_POS
-
-THREESPACE_FAMILY_DEV = "DEV"
-THREESPACE_FAMILY_USB = "USB"
-THREESPACE_FAMILY_WIRELESS = "WL"
-THREESPACE_FAMILY_EMBEDDED = "EM"
-THREESPACE_FAMILY_BLUETOOTH = "BT"
-THREESPACE_FAMILY_DATA_LOGGER = "DL"
-THREESPACE_FAMILY_MICRO_USB = "MUSB"
-THREESPACE_FAMILY_LX = "LX"
-
-THREESPACE_SN_FAMILY_TO_NAME = {
+THREESPACE_SETTING_KEY_INVALID_CHARS: Final[str] = " :;"
+
+THREESPACE_FILE_STREAMING_MAX_PACKET_SIZE: Final[int] = 512
+THREESPACE_LIVE_LOG_STREAM_MAX_PACKET_SIZE: Final[int] = 2048
+
+THREESPACE_MAX_CMD_LEN: Final[int] = 2048
+
+THREESPACE_SN_FAMILY_POS: Final[int] = 14 * 4
+THREESPACE_SN_VARIATION_POS: Final[int] = 11 * 4
+THREESPACE_SN_VERSION_POS: Final[int] = 10 * 4
+THREESPACE_SN_MAJOR_REVISION_POS: Final[int] = 8 * 4
+THREESPACE_SN_MINOR_REVISION_POS: Final[int] = 6 * 4
+THREESPACE_SN_INCREMENTOR_POS: Final[int] = 0 * 4
+
+THREESPACE_SN_FAMILY_MSK: Final[int] = 0xFF << THREESPACE_SN_FAMILY_POS
+THREESPACE_SN_VARIATION_MSK: Final[int] = 0xFFF << THREESPACE_SN_VARIATION_POS
+THREESPACE_SN_VERSION_MSK: Final[int] = 0xF << THREESPACE_SN_VERSION_POS
+THREESPACE_SN_MAJOR_REVISION_MSK: Final[int] = 0xFF << THREESPACE_SN_MAJOR_REVISION_POS
+THREESPACE_SN_MINOR_REVISION_MSK: Final[int] = 0xFF << THREESPACE_SN_MINOR_REVISION_POS
+THREESPACE_SN_INCREMENTOR_MSK: Final[int] = 0xFFFFFF << THREESPACE_SN_INCREMENTOR_POS
+
+THREESPACE_FAMILY_DEV: Final[str] = "DEV"
+THREESPACE_FAMILY_USB: Final[str] = "USB"
+THREESPACE_FAMILY_WIRELESS: Final[str] = "WL"
+THREESPACE_FAMILY_EMBEDDED: Final[str] = "EM"
+THREESPACE_FAMILY_BLUETOOTH: Final[str] = "BT"
+THREESPACE_FAMILY_DATA_LOGGER: Final[str] = "DL"
+THREESPACE_FAMILY_MICRO_USB: Final[str] = "MUSB"
+THREESPACE_FAMILY_LX: Final[str] = "LX"
+
+THREESPACE_SN_FAMILY_TO_NAME: Final[dict[int, str]] = {
     0x00 : THREESPACE_FAMILY_DEV,
     0x11 : THREESPACE_FAMILY_USB,
     0x12 : THREESPACE_FAMILY_WIRELESS,
@@ -81,4 +84,31 @@ THREESPACE_SN_FAMILY_TO_NAME = {
     0x21: THREESPACE_FAMILY_LX
 }
 
-THREESPACE_ERR_COMMIT_FS_LOCKED=8
\ No newline at end of file
+class ThreespaceSerialNumberFields(NamedTuple):
+    family_name: str
+    family_id: int
+    variation: int
+    core_version: int
+    major_revision: int
+    minor_revision: int
+    id: int
+
+@lru_cache(maxsize=256)
+def decode_sn(sn: int) -> ThreespaceSerialNumberFields:
+    """
+    Crack a serial number into its component fields in one pass.
+    Use this instead of re-implementing the mask/shift chain. Results are
+    cached since the same sensor's serial number is decoded many times.
+    """
+    family_id = (sn >> THREESPACE_SN_FAMILY_POS) & 0xFF
+    return ThreespaceSerialNumberFields(
+        THREESPACE_SN_FAMILY_TO_NAME.get(family_id, "Unknown"),
+        family_id,
+        (sn >> THREESPACE_SN_VARIATION_POS) & 0xFFF,
+        (sn >> THREESPACE_SN_VERSION_POS) & 0xF,
+        (sn >> THREESPACE_SN_MAJOR_REVISION_POS) & 0xFF,
+        (sn >> THREESPACE_SN_MINOR_REVISION_POS) & 0xFF,
+        (sn >> THREESPACE_SN_INCREMENTOR_POS) & 0xFFFFFF,
+    )
+
+THREESPACE_ERR_COMMIT_FS_LOCKED: Final[int] = 8
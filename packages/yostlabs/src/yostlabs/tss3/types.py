@@ -73,21 +73,16 @@ class ThreespaceHardwareVersion:
 
     @staticmethod
     def from_serial_number(serial_number: int):
-        family_id = (serial_number & THREESPACE_SN_FAMILY_MSK) >> THREESPACE_SN_FAMILY_POS
-        variation = (serial_number & THREESPACE_SN_VARIATION_MSK) >> THREESPACE_SN_VARIATION_POS
-        core_version = (serial_number & THREESPACE_SN_VERSION_MSK) >> THREESPACE_SN_VERSION_POS
-        major_revision = (serial_number & THREESPACE_SN_MAJOR_REVISION_MSK) >> THREESPACE_SN_MAJOR_REVISION_POS
-        minor_revision = (serial_number & THREESPACE_SN_MINOR_REVISION_MSK) >> THREESPACE_SN_MINOR_REVISION_POS
-        id = (serial_number & THREESPACE_SN_INCREMENTOR_MSK) >> THREESPACE_SN_INCREMENTOR_POS
+        fields = decode_sn(serial_number)
+        return ThreespaceHardwareVersion(serial_number, fields.family_id, fields.variation, fields.core_version,
+                                         fields.major_revision, fields.minor_revision, fields.id)
 
-        return ThreespaceHardwareVersion(serial_number, family_id, variation, core_version, major_revision, minor_revision, id)
-    
     def __str__(self):
         return f"{self.family_name} {self.variation:01X} V{self.core_version:01X}.{self.major_revision:01X}.{self.minor_revision:01X} {self.id:06X}"
-    
+
     @property
     def family_name(self):
-        return THREESPACE_SN_FAMILY_TO_NAME.get(self.family_id, "Unknown")
+        return decode_sn(self.serial_number).family_name
     
     @property
     def short_serial_number(self):